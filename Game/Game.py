@@ -1,8 +1,27 @@
+import itertools
 import random
+from enum import IntEnum
 
 import numpy as np
 
 
+# Numerical values of card types and abilities used in the state matrices
+TRANSFORM_VALUES = {
+    '0': 0,
+    'Unit': 0,
+    'Spy': 1,
+    'Hero': 1,
+    'Bond': 2,
+    'Decoy': 2,
+    'Morale': 3,
+    'Medic': 4,
+    'Scorch': 4,
+    'Agile': 5,
+    'Weather': 5,
+    'Muster': 6,
+}
+
+
 def transform(string):
     """
     Transforms a string into a corresponding numerical value.
@@ -14,20 +33,114 @@ def transform(string):
         int: The numerical value corresponding to the input string.
 
     """
-    return {
-        '0': 0,
-        'Unit': 0,
-        'Spy': 1,
-        'Hero': 1,
-        'Bond': 2,
-        'Decoy': 2,
-        'Morale': 3,
-        'Medic': 4,
-        'Scorch': 4,
-        'Agile': 5,
-        'Weather': 5,
-        'Muster': 6,
-    }.get(string, -1)
+    return TRANSFORM_VALUES.get(string, -1)
+
+
+# Labels of the scalar fields stored in the first row of the state matrix, with their column
+HEADER_LABELS = (
+    ('Lives player', 123),
+    ('Lives opponent', 124),
+    ('Card count player', 125),
+    ('Card count opponent', 126),
+    ('Additive modifier player melee', 127),
+    ('Additive modifier player ranged', 128),
+    ('Additive modifier player siege', 129),
+    ('Additive modifier opponent melee', 130),
+    ('Additive modifier opponent ranged', 131),
+    ('Additive modifier opponent siege', 132),
+    ('Multiplicative modifier player melee', 133),
+    ('Multiplicative modifier player ranged', 134),
+    ('Multiplicative modifier player siege', 135),
+    ('Multiplicative modifier opponent melee', 136),
+    ('Multiplicative modifier opponent ranged', 137),
+    ('Multiplicative modifier opponent siege', 138),
+    ('Score row melee player', 139),
+    ('Score row ranged player', 140),
+    ('Score row siege player', 141),
+    ('Score row melee opponent', 142),
+    ('Score row ranged opponent', 143),
+    ('Score row siege opponent', 144),
+    ('Score player', 145),
+    ('Score opponent', 146),
+    ('Passed opponent', 147),
+)
+
+
+def format_state_row(state, row, strength_row=None):
+    """
+    Formats the cards present in one row of the state matrix for console output.
+
+    Args:
+        state (ndarray): The state matrix of the game.
+        row (int): Index of the row holding card counts.
+        strength_row (int, optional): Index of the row holding combined strength of the cards.
+
+    Returns:
+        str: Description of every card with a positive count in the row.
+
+    """
+    counts = state[row, :120]
+    ids = np.flatnonzero(counts > 0)
+    if strength_row is None:
+        return ''.join(f'id: {i} count: {counts[i]} ' for i in ids)
+    strengths = state[strength_row]
+    return ''.join(f'id: {i} count: {counts[i]} Current strength combined: {strengths[i]} ' for i in ids)
+
+
+class Ability(IntEnum):
+    """
+    Abilities of cards. Cards store these integer codes instead of the ability names used in the card data.
+    """
+    NONE = 0
+    SPY = 1
+    BOND = 2
+    MORALE = 3
+    MEDIC = 4
+    AGILE = 5
+    MUSTER = 6
+    SCORCH = 7
+    WEATHER = 8
+    DECOY = 9
+
+
+ABILITY_BY_NAME = {
+    '0': Ability.NONE,
+    'Spy': Ability.SPY,
+    'Bond': Ability.BOND,
+    'Morale': Ability.MORALE,
+    'Medic': Ability.MEDIC,
+    'Agile': Ability.AGILE,
+    'Muster': Ability.MUSTER,
+    'Scorch': Ability.SCORCH,
+    'Weather': Ability.WEATHER,
+    'Decoy': Ability.DECOY,
+}
+
+
+class CardType(IntEnum):
+    """
+    Types of cards. The codes match the values `transform` gives to the type names in the state matrices.
+    """
+    UNIT = 0
+    HERO = 1
+    DECOY = 2
+    MORALE = 3
+    SCORCH = 4
+    WEATHER = 5
+
+
+# Dandelion is the only unit whose Morale ability doubles its row like Commanders Horn
+DANDELION_ID = 52
+
+
+TYPE_BY_NAME = {
+    'Unit': CardType.UNIT,
+    'Hero': CardType.HERO,
+    'Decoy': CardType.DECOY,
+    'Morale': CardType.MORALE,
+    'Scorch': CardType.SCORCH,
+    'Weather': CardType.WEATHER,
+}
 
 
 class Game:
@@ -41,18 +154,45 @@ class Game:
             and a value of 1 indicates that it is the second player's turn.
         all_cards: list
             A list of all available cards in the game.
+        all_cards_list: list
+            All available cards flattened from their groups into a single list.
         players: list
             A list containing two `Player` objects, representing the two players in the game.
         board: Board
             A `Board` object representing the game board.
         actions: list
             A list of actions that the current player can take in their turn.
+        starting_state: ndarray
+            A 4x120 matrix with strength, type, ability and placement of each card.
         end: bool
             A boolean value indicating whether the game has ended.
         cards_by_id: dict
             A dictionary mapping card IDs to card objects.
+        type_code_by_id: ndarray
+            An array of length 120 with the transformed type of each card.
+        ability_code_by_id: ndarray
+            An array of length 120 with the transformed ability of each card.
+        card_prototypes: dict
+            A dictionary mapping card IDs to the unplayed Card objects that `create_card` copies.
+        placement_by_id: ndarray
+            An array of length 120 with the default placement of each card.
         actions_index_by_id: dict
             A dictionary mapping actions by format of action  "<card_id>,<position>,<special_arg>".
+        action_index_table: ndarray
+            A 120x5x121 array mapping (card_id, position, special_arg + 1) of every action to its index,
+            -1 where no such action exists.
+        pass_action_index: int
+            The index of the pass action.
+        plain_action_by_id: ndarray
+            A boolean array of length 120, True for cards whose only action is placing them with their
+            own placement and special argument (every card except Medic, Decoy and Morale cards).
+        actions_parsed: list
+            A list parallel to `actions` holding each action as a tuple (card_id, position, special_arg),
+            None for the pass action.
+        valid_actions_cache: tuple
+            The last list of valid actions together with the GameState version and turn it was computed for.
+        valid_actions_mask: ndarray
+            A preallocated boolean buffer, one element per action, holding the last mask of `valid_actions`.
     """
 
     def __init__(self, all_cards):
@@ -68,20 +208,31 @@ class Game:
         self.turn = 0
         self.all_cards = all_cards
         self.game_state_matrix = GameState()
-        self.game_state_matrix.starting_state(self.all_cards)
-        self.cards_by_id = {}
         self.actions_index_by_id = {}
-        for group in self.all_cards.values():
-            for card in group:
-                self.cards_by_id[card['Id']] = card
+        self.action_index_table = np.full((120, 5, 121), -1, dtype=np.int16)
+        self.pass_action_index = -1
+        self.actions_parsed = []
+        self.all_cards_list = list(itertools.chain.from_iterable(self.all_cards.values()))
+        self.cards_by_id = {card['Id']: card for card in self.all_cards_list}
+        self.card_prototypes = {}
+        self.type_code_by_id = np.zeros(120, dtype=np.int8)
+        self.ability_code_by_id = np.zeros(120, dtype=np.int8)
+        self.placement_by_id = np.zeros(120, dtype=np.int8)
+        self.plain_action_by_id = np.zeros(120, dtype=bool)
+        for card_id, card in self.cards_by_id.items():
+            self.type_code_by_id[card_id] = transform(card['Type'])
+            self.ability_code_by_id[card_id] = transform(card['Ability'])
+            self.placement_by_id[card_id] = card['Placement']
+            self.plain_action_by_id[card_id] = card['Ability'] != 'Medic' and card['Type'] not in ('Decoy', 'Morale')
         self.players = [Player(0, self.create_deck(0, 2), self.game_state_matrix),
                         Player(1, self.create_deck(1, 2), self.game_state_matrix)]
         self.board = Board(self.players, self.game_state_matrix)
-        self.starting_state()
+        self.starting_state = self.create_starting_state()
+        self.game_state_matrix.starting_state(self.starting_state)
         self.actions = self.create_actions()
         self.end = False
-
-        self.starting_state = self.starting_state()
+        self.valid_actions_cache = None
+        self.valid_actions_mask = np.zeros(len(self.actions), dtype=bool)
 
     def step(self, action):
         """
@@ -105,51 +256,43 @@ class Game:
         Raises:
             None
         """
-        if self.actions[action] == '-1':
+        turn = self.turn
+        player = self.players[turn]
+        opponent = self.players[turn ^ 1]
+        parsed_action = self.actions_parsed[action]
+        if parsed_action is None:
             # -1 is last action that is available until player takes this action
-            self.players[self.turn].pass_game()
+            player.pass_game()
             # Both players passed end of round
-            if self.players[self.turn].passed and self.players[self.turn ^ 1].passed:
-                if self.board.player_strength[self.turn] > self.board.player_strength[self.turn ^ 1]:
-                    # Player 0 wins round P1 take damage
-                    self.players[self.turn ^ 1].take_damage()
-                    self.players[self.turn].new_game()
-                    self.players[self.turn ^ 1].new_game()
-                    result = self.check_game_end()
-                    if not result == 0:
-                        return result
-                    return 1
-                elif self.board.player_strength[self.turn] < self.board.player_strength[self.turn ^ 1]:
-                    # Player 1 wins round P0 take damage
-                    self.players[self.turn].take_damage()
-                    self.players[self.turn].new_game()
-                    self.players[self.turn ^ 1].new_game()
-                    result = self.check_game_end()
-                    if not result == 0:
-                        return result
-                    return 2
+            if player.passed and opponent.passed:
+                player_strength = self.board.player_strength
+                difference = player_strength[turn] - player_strength[turn ^ 1]
+                # Player in turn wins round: opponent takes damage, opponent wins: player takes damage,
+                # tie: both take damage
+                if difference > 0:
+                    round_result, losers = 1, (opponent,)
+                elif difference < 0:
+                    round_result, losers = 2, (player,)
                 else:
-                    # Tie both take damage
-                    self.players[self.turn].take_damage()
-                    self.players[self.turn ^ 1].take_damage()
-                    self.players[self.turn].new_game()
-                    self.players[self.turn ^ 1].new_game()
-                    result = self.check_game_end()
-                    if not result == 0:
-                        return result
-                    return 3
+                    round_result, losers = 3, (player, opponent)
+                for loser in losers:
+                    loser.take_damage()
+                player.new_game()
+                opponent.new_game()
+                result = self.check_game_end()
+                if not result == 0:
+                    return result
+                return round_result
         else:
             # If action is other than pass find card in player's hand and set argument's than play card on board
-            card_id = int(self.actions[action].split(',')[0])
-            position = int(self.actions[action].split(',')[1])
-            special_arg = int(self.actions[action].split(',')[2])
-            card = self.players[self.turn].get_card_by_id(card_id)
+            card_id, position, special_arg = parsed_action
+            card = player.get_card_by_id(card_id)
             card.placement = position
             card.special_argument = special_arg
-            self.board.place_card(card, self.turn)
+            self.board.place_card(card, turn)
 
-        if not self.players[self.turn ^ 1].passed:
-            self.turn = self.turn ^ 1
+        if not opponent.passed:
+            self.turn = turn ^ 1
         return 0
 
     def game_state(self):
@@ -238,21 +381,24 @@ class Game:
         """
         return self.cards_by_id.get(_id)
 
-    def starting_state(self):
+    def create_starting_state(self):
         """
-        Initializes the starting state of the game by populating the `state` dictionary with information about every
-        card.
+        Creates the starting state of the game with information about every card.
+
+        Returns:
+            ndarray[int]:
+                4x120 matrix with strength, type, ability and placement of each card.
         """
 
         # Starting state of game, information about every card
-
-        state = np.zeros((4, 120))
-        for group in self.all_cards.values():
-            for card in group:
-                state[0][card['Id']] = card['Strength']
-                state[1][card['Id']] = transform(card['Type'])
-                state[2][card['Id']] = transform(card['Ability'])
-                state[3][card['Id']] = card['Placement']
+        cards = self.all_cards_list
+        ids = np.fromiter((card['Id'] for card in cards), dtype=np.intp, count=len(cards))
+
+        state = np.zeros((4, 120), dtype=np.int16)
+        state[0, ids] = [card['Strength'] for card in cards]
+        state[1] = self.type_code_by_id
+        state[2] = self.ability_code_by_id
+        state[3] = self.placement_by_id
         return state
 
     def create_card(self, id_card):
@@ -268,21 +414,27 @@ class Game:
                 A Card object with the specified information.
 
         """
-        card_data = self.get_card_data_by_id(id_card)
-        return Card(
-            name=card_data['Name'],
-            ability=card_data['Ability'],
-            strength=card_data['Strength'],
-            _id=int(card_data['Id']),
-            _type=card_data['Type'],
-            placement=card_data['Placement'],
-        )
+        # Every card is built once and later cards with the same id are copies of it
+        prototype = self.card_prototypes.get(id_card)
+        if prototype is None:
+            card_data = self.get_card_data_by_id(id_card)
+            prototype = Card(
+                name=card_data['Name'],
+                ability=card_data['Ability'],
+                strength=card_data['Strength'],
+                _id=int(card_data['Id']),
+                _type=card_data['Type'],
+                placement=card_data['Placement'],
+            )
+            self.card_prototypes[id_card] = prototype
+        return prototype.copy()
 
     def get_id_card_of_action(self, action):
-        full_format=self.actions[action]
-        split = full_format.split(',')
-        ID=int(split[0])
-        return ID
+        parsed = self.actions_parsed[action]
+        # Pass action has no card
+        if parsed is None:
+            return -1
+        return parsed[0]
 
     def create_actions(self):
         """
@@ -293,14 +445,18 @@ class Game:
                 A list of actions as strings.
         """
         result = []  # Create an empty list to hold the resulting actions
-        all_cards = []  # Create an empty list to hold all cards in the game
-
-        # Loop through each card group in the game and add each card to the all_cards list
-        for group, cards in self.all_cards.items():
-            for card in cards:
-                all_cards.append(card)
-
-        # Loop through each card in the all_cards list and create actions for them
+        all_cards = self.all_cards_list
+
+        # Group units once so Decoy and Medic cards only visit the units they can target
+        units = [card for card in all_cards if card['Type'] == 'Unit']
+        units_by_faction = {}
+        for unit in units:
+            units_by_faction.setdefault(unit['Faction'], []).append(unit)
+        # Spies and neutral units can be targeted by cards of any faction
+        shared_units = [unit for unit in units if unit['Ability'] == 'Spy' or unit['Faction'] == 'Neutral']
+
+        # Loop through each card in the all_cards list and create actions for them as
+        # (card_id, position, special_arg) tuples
         for card in all_cards:
             special_arg = -1
 
@@ -308,39 +464,43 @@ class Game:
             if card['Ability'] == 'Decoy' or card['Ability'] == 'Medic':
                 if card['Ability'] == 'Medic':
                     # Action without revive
-                    card_str = str(card['Id']) + ',' + str(card['Placement']) + ',' + str(special_arg)
-                    result.append(card_str)
-                for other_card in all_cards:
-                    if other_card['Type'] == 'Unit':
-                        if other_card['Faction'] == card['Faction'] or other_card['Ability'] == 'Spy' or card[
-                            'Faction'] == 'Neutral' or other_card['Faction'] == 'Neutral':
-                            if card['Type'] == 'Decoy':
-                                result.append(
-                                    str(card['Id']) + ',' + str(other_card['Placement']) + ',' + str(other_card['Id']))
-                            else:
-                                result.append(
-                                    str(card['Id']) + ',' + str(card['Placement']) + ',' + str(other_card['Id']))
+                    result.append((card['Id'], card['Placement'], special_arg))
+                if card['Faction'] == 'Neutral':
+                    targets = units
+                else:
+                    targets = units_by_faction.get(card['Faction'], []) + [
+                        unit for unit in shared_units if unit['Faction'] != card['Faction']]
+                for other_card in targets:
+                    if card['Type'] == 'Decoy':
+                        result.append((card['Id'], other_card['Placement'], other_card['Id']))
+                    else:
+                        result.append((card['Id'], card['Placement'], other_card['Id']))
             elif card['Type'] == 'Morale':
                 for i in range(3):
-                    card_str = str(card['Id']) + ',' + str(i) + ',' + str(special_arg)
-                    result.append(card_str)
+                    result.append((card['Id'], i, special_arg))
             else:
                 # Otherwise, create a simple action for the card with a default special_arg
-                card_str = str(card['Id']) + ',' + str(card['Placement']) + ',' + str(special_arg)
-                result.append(card_str)
+                result.append((card['Id'], card['Placement'], special_arg))
+
+        # Sort the resulting actions by card_id, placement, and special_arg
+        result.sort()
 
-        # Sort the resulting actions list by card_id, placement, and special_arg
-        result = sorted(
-            result,
-            key=lambda x: (int(x.split(',')[0]), int(x.split(',')[1]), int(x.split(',')[2]))
-        )
+        # Keep parsed actions so step doesn't have to split strings
+        self.actions_parsed = result
+        result = [str(card_id) + ',' + str(position) + ',' + str(special_arg)
+                  for card_id, position, special_arg in self.actions_parsed]
 
         # Add a pass action -1 to the end of the actions list
         result.append('-1')
+        self.actions_parsed.append(None)
 
         for index, action in enumerate(result):
             self.actions_index_by_id[action] = index
 
+        for index, (card_id, position, special_arg) in enumerate(self.actions_parsed[:-1]):
+            self.action_index_table[card_id, position, special_arg + 1] = index
+        self.pass_action_index = len(result) - 1
+
         return result
 
     def check_game_end(self):
@@ -356,14 +516,17 @@ class Game:
                     - 6: Both players have lost
         """
 
+        lives = self.players[self.turn].lives
+        lives_opponent = self.players[self.turn ^ 1].lives
+
         # Check if the game ends due to a player running out of lives
-        if self.players[self.turn].lives <= 0 and self.players[self.turn ^ 1].lives > 0:
+        if lives <= 0 and lives_opponent > 0:
             self.end = True
             return 4  # Current Player lost
-        elif self.players[self.turn ^ 1].lives <= 0 and self.players[self.turn].lives > 0:
+        elif lives_opponent <= 0 and lives > 0:
             self.end = True
             return 5  # Opponent Player lost
-        elif self.players[self.turn].lives <= 0 and self.players[self.turn ^ 1].lives <= 0:
+        elif lives <= 0 and lives_opponent <= 0:
             self.end = True
             return 6  # Both players lost
         # Clear the game board
@@ -376,77 +539,93 @@ class Game:
         are valid along with list of actions.
 
         Returns:
-            Tuple[List[bool], List[str]]:
+            Tuple[ndarray, List[str]]:
                 A tuple containing a boolean array indicating which actions are valid, and a list
-                of valid actions.
-        """
-        # Create a list of zeros with the same length as the list of actions
-        result = [False for _ in range(len(self.actions))]
-        # Create an empty list to store only the valid actions
-        valid_actions = []
-
-        # Iterate through each card in the current player's hand
-        for card in self.players[self.turn].hand:
-            # Check if the card is not a Medic and not a Decoy
-            if not card.ability == 'Medic' and not card.type == 'Decoy' and not card.type == 'Morale':
-                # Generate a unique action ID for the card and get its index in the list of actions
-                action_id = str(card.id) + ',' + str(card.placement) + ',' + str(card.special_argument)
-                index = self.get_index_of_action(action_id)
-                # Mark the corresponding element in the result list as True
-                result[index] = True
-                # Add the action ID to the list of valid actions
-                valid_actions.append(action_id)
-
-            # Check if the card is a Medic
-            elif card.ability == 'Medic':
-                # Action without revive
-                action_no_revive = str(card.id) + ',' + str(card.placement) + ',' + str(-1)
-                index = self.get_index_of_action(action_no_revive)
-                result[index] = True
-                valid_actions.append(action_no_revive)
-                # Iterate through each card in the current player's graveyard
-                for grave_card_list in self.board.graveyards[self.turn].cards.values():
-                    # Check if the card in the graveyard is a Unit
-                    if grave_card_list:
-                        if grave_card_list[0].type == 'Unit':
-                            # Generate a unique action ID for the Medic card and the graveyard card
-                            action_id = str(card.id) + ',' + str(card.placement) + ',' + str(grave_card_list[0].id)
-                            index = self.get_index_of_action(action_id)
-                            # Mark the corresponding element in the result list as True
-                            result[index] = True
-                            # Add the action ID to the list of valid actions
-                            valid_actions.append(action_id)
-
-            # Check if the card is a Decoy
-            elif card.type == 'Decoy':
-                # Iterate through each row on the board that corresponds to the current player
-                for i in range(3 * self.turn, 3 * self.turn + 3):
-                    # Iterate through each card in the current row
-                    for row_card_list in self.board.rows[i].cards.values():
-                        # Generate a unique action ID for the Decoy card and the row card
-                        if row_card_list and row_card_list[0].type == 'Unit':
-                            action_id = str(card.id) + ',' + str(row_card_list[0].placement) + ',' + str(
-                                row_card_list[0].id)
-                            index = self.get_index_of_action(action_id)
-                            # Mark the corresponding element in the result list as True
-                            result[index] = True
-                            # Add the action ID to the list of valid actions
-                            valid_actions.append(action_id)
-            elif card.type == 'Morale':
-                for i in range(3):
-                    action_id = str(card.id) + ',' + str(i) + ',' + str(card.special_argument)
-                    index = self.get_index_of_action(action_id)
-                    # Mark the corresponding element in the result list as True
-                    result[index] = True
-                    # Add the action ID to the list of valid actions
-                    valid_actions.append(action_id)
+                of valid actions. Every call returns new objects, so the caller may modify them.
+        """
+        # Valid actions only depend on the turn and on what GameState.version tracks, so the last result stays
+        # valid while both are unchanged
+        key = (self.game_state_matrix.version, self.turn)
+        if self.valid_actions_cache is not None and self.valid_actions_cache[0] == key:
+            return self.valid_actions_mask.copy(), list(self.valid_actions_cache[1])
+
+        turn = self.turn
+        player = self.players[turn]
+        action_index_table = self.action_index_table
+        hand_size = len(player.hand)
+        hand_ids = player.hand_ids[:hand_size]
+        # Look up the plain action of every card in hand at once, it is only valid for cards without
+        # Medic, Decoy and Morale
+        # Missing actions are -1 in the table, e.g. for cards of another faction given to the player
+        plain = self.plain_action_by_id[hand_ids]
+        plain_indices = action_index_table[hand_ids, player.hand_placements[:hand_size],
+                                           player.hand_special_arguments[:hand_size] + 1]
+
+        if plain.all():
+            indices = plain_indices[plain_indices >= 0].tolist()
+        else:
+            # Create an empty list to store indices of the valid actions
+            indices = []
+            plain_indices = plain_indices.tolist()
+            # Targets of Medic and Decoy cards are collected at most once, however many of them are in hand
+            revive_targets = None
+            decoy_targets = None
+
+            # Iterate through each card in the current player's hand
+            for position, card in enumerate(player.hand):
+                # Check if the card is not a Medic and not a Decoy
+                if plain[position]:
+                    # Mark the card's action as valid
+                    if plain_indices[position] >= 0:
+                        indices.append(plain_indices[position])
+
+                # Check if the card is a Medic
+                elif card.ability == Ability.MEDIC:
+                    if revive_targets is None:
+                        # IDs of the Unit cards in the current player's graveyard
+                        revive_targets = np.array(
+                            [grave_card_list[0].id for grave_card_list in self.board.graveyards[turn].cards.values()
+                             if grave_card_list and grave_card_list[0].type == CardType.UNIT], dtype=np.intp)
+                    # Action without revive, the table holds -1 for actions that do not exist
+                    no_revive_index = action_index_table[card.id, card.placement, 0]
+                    if no_revive_index >= 0:
+                        indices.append(no_revive_index)
+                    # Mark the actions reviving the graveyard cards with the Medic card as valid, units of other
+                    # factions can be in the graveyard without a revive action
+                    revive_indices = action_index_table[card.id, card.placement, revive_targets + 1]
+                    indices.extend(revive_indices[revive_indices >= 0].tolist())
+
+                # Check if the card is a Decoy
+                elif card.type == CardType.DECOY:
+                    if decoy_targets is None:
+                        # Placements and IDs of the Unit cards in rows of the current player
+                        decoy_targets = np.array(
+                            [(row_card_list[0].placement, row_card_list[0].id)
+                             for row in self.board.rows[3 * turn:3 * turn + 3]
+                             for row_card_list in row.cards.values()
+                             if row_card_list and row_card_list[0].type == CardType.UNIT], dtype=np.intp).reshape(-1, 2)
+                    # Mark the actions swapping the Decoy card with the row cards as valid
+                    decoy_indices = action_index_table[card.id, decoy_targets[:, 0], decoy_targets[:, 1] + 1]
+                    indices.extend(decoy_indices[decoy_indices >= 0].tolist())
+                elif card.type == CardType.MORALE:
+                    for i in range(3):
+                        # Mark the corresponding action as valid if it exists
+                        morale_index = action_index_table[card.id, i, card.special_argument + 1]
+                        if morale_index >= 0:
+                            indices.append(morale_index)
 
         # Action for pass
-        if not self.board.players[self.turn].passed:
-            result[self.get_index_of_action('-1')] = True
-            valid_actions.append('-1')
-        # Return both the result list and the list of valid actions
-        return result, valid_actions
+        if not player.passed:
+            indices.append(self.pass_action_index)
+
+        # Reuse the mask buffer and hand the caller its own copies
+        self.valid_actions_mask.fill(False)
+        self.valid_actions_mask[indices] = True
+        actions = self.actions
+        valid_actions = [actions[index] for index in indices]
+        self.valid_actions_cache = (key, valid_actions)
+        # Return both the result mask and the list of valid actions
+        return self.valid_actions_mask.copy(), list(valid_actions)
 
     def get_index_of_action(self, action):
         """
@@ -480,127 +659,29 @@ class Game:
             None
         """
         state = self.game_state()
-
-        out = 'Player ' + str(self.turn)
-        out += '\nPlayer hand: '
-        for i in range(120):
-            if state[0][i] > 0:
-                out += 'id: ' + str(i) + ' count: ' + str(state[0][i]) + ' '
-
-        out += '\nPlayer melee: '
-        for i in range(120):
-            if state[1][i] > 0:
-                out += 'id: ' + str(i) + ' count: ' + str(state[1][i]) + ' Current strength combined: ' + str(
-                    state[2][i]) + ' '
-
-        out += '\nPlayer ranged: '
-        for i in range(120):
-            if state[3][i] > 0:
-                out += 'id: ' + str(i) + ' count: ' + str(state[3][i]) + ' Current strength combined: ' + str(
-                    state[4][i]) + ' '
-
-        out += '\nPlayer siege: '
-        for i in range(120):
-            if state[5][i] > 0:
-                out += 'id: ' + str(i) + ' count: ' + str(state[5][i]) + ' Current strength combined: ' + str(
-                    state[6][i]) + ' '
-
-        out += '\nOpponent melee: '
-        for i in range(120):
-            if state[7][i] > 0:
-                out += 'id: ' + str(i) + ' count: ' + str(state[7][i]) + ' Current strength combined: ' + str(
-                    state[8][i]) + ' '
-
-        out += '\nOpponent ranged: '
-        for i in range(120):
-            if state[9][i] > 0:
-                out += 'id: ' + str(i) + ' count: ' + str(state[9][i]) + ' Current strength combined: ' + str(
-                    state[10][i]) + ' '
-
-        out += '\nOpponent siege: '
-        for i in range(120):
-            if state[11][i] > 0:
-                out += 'id: ' + str(i) + ' count: ' + str(state[11][i]) + ' Current strength combined: ' + str(
-                    state[12][i]) + ' '
-
-        out += '\nPlayer graveyard: '
-        for i in range(120):
-            if state[13][i] > 0:
-                out += 'id: ' + str(i) + ' count: ' + str(state[13][i]) + ' '
-
-        out += '\nOpponent graveyard: '
-        for i in range(120):
-            if state[14][i] > 0:
-                out += 'id: ' + str(i) + ' count: ' + str(state[14][i]) + ' '
-
-        out += '\nPlayer deck:'
-        for i in range(120):
-            if state[15][i] > 0:
-                out += 'id: ' + str(i) + ' count: ' + str(state[15][i]) + ' '
-
-        out += '\nWeather: '
-        for i in range(3):
-            out += str(state[0][120 + i]) + ' '
-
-        out += '\nLives player: '
-        out += str(state[0][123])
-        out += '\nLives opponent: '
-        out += str(state[0][124])
-        out += '\nCard count player: '
-        out += str(state[0][125])
-        out += '\nCard count opponent: '
-        out += str(state[0][126])
-        out += '\nAdditive modifier player melee: '
-        out += str(state[0][127])
-        out += '\nAdditive modifier player ranged: '
-        out += str(state[0][128])
-        out += '\nAdditive modifier player siege: '
-        out += str(state[0][129])
-        out += '\nAdditive modifier opponent melee: '
-        out += str(state[0][130])
-        out += '\nAdditive modifier opponent ranged: '
-        out += str(state[0][131])
-        out += '\nAdditive modifier opponent siege: '
-        out += str(state[0][132])
-        out += '\nMultiplicative modifier player melee: '
-        out += str(state[0][133])
-        out += '\nMultiplicative modifier player ranged: '
-        out += str(state[0][134])
-        out += '\nMultiplicative modifier player siege: '
-        out += str(state[0][135])
-        out += '\nMultiplicative modifier opponent melee: '
-        out += str(state[0][136])
-        out += '\nMultiplicative modifier opponent ranged: '
-        out += str(state[0][137])
-        out += '\nMultiplicative modifier opponent siege: '
-        out += str(state[0][138])
-        out += '\nScore row melee player: '
-        out += str(state[0][139])
-        out += '\nScore row ranged player: '
-        out += str(state[0][140])
-        out += '\nScore row siege player: '
-        out += str(state[0][141])
-        out += '\nScore row melee opponent: '
-        out += str(state[0][142])
-        out += '\nScore row ranged opponent: '
-        out += str(state[0][143])
-        out += '\nScore row siege opponent: '
-        out += str(state[0][144])
-        out += '\nScore player: '
-        out += str(state[0][145])
-        out += '\nScore opponent: '
-        out += str(state[0][146])
-        out += '\nPassed opponent: '
-        out += str(state[0][147])
-        out += '\nActions: '
+        header = state[0]
+
+        parts = ['Player ', str(self.turn),
+                 '\nPlayer hand: ', format_state_row(state, 0),
+                 '\nPlayer melee: ', format_state_row(state, 1, 2),
+                 '\nPlayer ranged: ', format_state_row(state, 3, 4),
+                 '\nPlayer siege: ', format_state_row(state, 5, 6),
+                 '\nOpponent melee: ', format_state_row(state, 7, 8),
+                 '\nOpponent ranged: ', format_state_row(state, 9, 10),
+                 '\nOpponent siege: ', format_state_row(state, 11, 12),
+                 '\nPlayer graveyard: ', format_state_row(state, 13),
+                 '\nOpponent graveyard: ', format_state_row(state, 14),
+                 '\nPlayer deck:', format_state_row(state, 15),
+                 '\nWeather: ', ''.join(f'{value} ' for value in header[120:123])]
+        parts.extend(f'\n{label}: {header[index]}' for label, index in HEADER_LABELS)
 
         valid_actions_bool, valid_actions_list = self.valid_actions()
 
-        for action in valid_actions_list:
-            out += action + ' '
-        out += '\n'
+        parts.append('\nActions: ')
+        parts.extend(action + ' ' for action in valid_actions_list)
+        parts.append('\n')
 
-        return out
+        return ''.join(parts)
 
     def give_card(self, player_id, card_id):
         self.players[player_id].add_card(self.create_card(card_id))
@@ -643,6 +724,7 @@ class Board:
     def place_card(self, card, turn):
         """
         Places a card on the board and applies its ability if it has one.
+        The placement method for the card's ability is chosen once when the card is created (see `Card.place`).
 
         Args:
             card (Card):
@@ -654,147 +736,151 @@ class Board:
             bool:
                 True if the card was successfully placed, False otherwise.
         """
-        placement = card.placement
-        # Turn 0 - player 0, turn 1 - player 1
-        row_index = card.placement + (3 * turn)
+        return card.place(self, card, turn)
 
-        # Check if the card's ability is "Weather"
-        if card.ability == "Weather":
-            if card.placement < 3:
-                self.rows[card.placement].activate_weather()
-                self.rows[card.placement + 3].activate_weather()
-            else:
-                for row in self.rows:
-                    row.clear_weather()
-            self.calculate_strength()
-            return True
-
-        # Check if the card's ability is "Spy"
-        elif card.ability == "Spy":
-            # Change the placement as if the turn was opposite to current turn
-            if turn == 0:
-                row_index = placement + 3
-            elif turn == 1:
-                row_index = placement
-            # Player draws 2 cards if Spy is played
-            self.players[turn].draw()
-            self.players[turn].draw()
-            self.rows[row_index].add_card(card)
-            self.calculate_strength()
-            return True
+    def place_weather(self, card, turn):
+        """
+        Activates weather on both rows of the card's placement, or clears weather on all rows.
+        """
+        if card.placement < 3:
+            self.rows[card.placement].activate_weather()
+            self.rows[card.placement + 3].activate_weather()
+        else:
+            for row in self.rows:
+                row.clear_weather()
+        self.calculate_strength()
+        return True
 
-        # Check if the card's ability is "Bond"
-        elif card.ability == "Bond":
-            self.rows[row_index].add_card(card)
-            self.calculate_strength()
-            return True
+    def place_spy(self, card, turn):
+        """
+        Places the card on the opponent's side of the board and draws 2 cards for the player.
+        """
+        # Change the placement as if the turn was opposite to current turn
+        row_index = card.placement + (3 * (turn ^ 1))
+        # Player draws 2 cards if Spy is played
+        self.players[turn].draw()
+        self.players[turn].draw()
+        self.rows[row_index].add_card(card)
+        self.calculate_strength(turn ^ 1)
+        return True
 
-        # Check if the card's ability is "Morale"
-        elif card.ability == "Morale":
-            self.rows[row_index].add_card(card)
-            self.calculate_strength()
-            return True
+    def place_scorch(self, card, turn):
+        """
+        Destroys the strongest non-hero cards on the board, moving them to their owner's graveyard.
+        """
+        # Every row keeps its highest non-hero strength up to date, so only the 6 cached values are compared
+        highest = max(row.highest_value_non_hero for row in self.rows)
+        to_remove = [i for i, row in enumerate(self.rows) if row.highest_value_non_hero == highest]
 
-        # Check if the card's ability is "Scorch"
-        elif card.ability == "Scorch":
-            highest = -1
-            to_remove = []
-            for row in self.rows:
-                if row.highest_value_non_hero > highest:
-                    highest = row.highest_value_non_hero
-            for row in self.rows:
-                if row.highest_value_non_hero == highest:
-                    to_remove.append(row)
-
-            for row in to_remove:
-                cards = row.remove_highest_value_cards()
-                index = self.rows.index(row)
-                if index < 3:
-                    self.graveyards[0].add_cards(cards)
-                else:
-                    self.graveyards[1].add_cards(cards)
-            if card.placement < 3:
-                self.rows[row_index].add_card(card)
-            self.calculate_strength()
-            return True
+        for i in to_remove:
+            cards = self.rows[i].remove_highest_value_cards()
+            self.graveyards[i // 3].add_cards(cards)
+        if card.placement < 3:
+            self.rows[card.placement + (3 * turn)].add_card(card)
+        self.calculate_strength()
+        return True
 
-        # Check if the card's ability is "Muster"
-        elif card.ability == "Muster":
-            player_deck = self.players[turn].deck
-            cards_to_place = player_deck.draw_card_by_id(card.id)
-            cards_to_place.append(card)
-            self.rows[row_index].add_cards(card.id, cards_to_place)
-            self.calculate_strength()
-            return True
+    def place_muster(self, card, turn):
+        """
+        Places the card together with all cards of the same ID from the player's deck.
+        """
+        player_deck = self.players[turn].deck
+        cards_to_place = player_deck.draw_card_by_id(card.id)
+        cards_to_place.append(card)
+        self.rows[card.placement + (3 * turn)].add_cards(card.id, cards_to_place)
+        self.calculate_strength(turn)
+        return True
 
-        # Check if the card's ability is "Medic"
-        elif card.ability == "Medic":
-            player_graveyard = self.graveyards[turn]
-            if card.special_argument == -1:
-                self.rows[row_index].add_card(card)
-                self.calculate_strength()
-                return True
-            revived_cards = player_graveyard.revive_cards(card.special_argument)
+    def place_medic(self, card, turn):
+        """
+        Places the card and revives the card chosen by its special argument from the player's graveyard.
+        """
+        row_index = card.placement + (3 * turn)
+        player_graveyard = self.graveyards[turn]
+        if card.special_argument == -1:
             self.rows[row_index].add_card(card)
-            for revived_card in revived_cards:
-                index = revived_card.placement + (3 * turn)
-                self.rows[index].add_card(revived_card)
-            self.calculate_strength()
+            self.calculate_strength(turn)
             return True
+        revived_cards = player_graveyard.revive_cards(card.special_argument)
+        self.rows[row_index].add_card(card)
+        for revived_card in revived_cards:
+            index = revived_card.placement + (3 * turn)
+            self.rows[index].add_card(revived_card)
+        self.calculate_strength(turn)
+        return True
 
-        # Check if the card's ability is "Decoy"
-        elif card.ability == "Decoy":
-            removed_card = self.rows[row_index].remove_card_by_id(card.special_argument)
-            self.players[turn].add_card(removed_card)
-            self.calculate_strength()
-            return True
+    def place_decoy(self, card, turn):
+        """
+        Takes the card chosen by the decoy's special argument from the board back to the player's hand.
+        """
+        removed_card = self.rows[card.placement + (3 * turn)].remove_card_by_id(card.special_argument)
+        self.players[turn].add_card(removed_card)
+        self.calculate_strength(turn)
+        return True
 
-        self.rows[row_index].add_card(card)
-        self.calculate_strength()
+    def place_default(self, card, turn):
+        """
+        Places the card on its row, used for cards whose ability takes effect inside the row (Bond, Morale, ...).
+        """
+        self.rows[card.placement + (3 * turn)].add_card(card)
+        self.calculate_strength(turn)
         return True
 
-    def calculate_strength(self):
+    def calculate_strength(self, side=None):
         """
         Recalculates strength after placing card.
-        """
-        self.player_strength = [0, 0]
-        for i in range(6):
-            if i < 3:
-                self.player_strength[0] += self.rows[i].row_strength
-                self.game_state_matrix.change_score_player(0, self.player_strength[0])
-            else:
-                self.player_strength[1] += self.rows[i].row_strength
-                self.game_state_matrix.change_score_player(1, self.player_strength[1])
+
+        Args:
+            side (int, optional):
+                The player whose rows changed. If None, strength of both players is recalculated.
+        """
+        if side is None:
+            self.calculate_strength(0)
+            self.calculate_strength(1)
+            return
+        rows = self.rows
+        first = 3 * side
+        self.player_strength[side] = rows[first].row_strength + rows[first + 1].row_strength + \
+            rows[first + 2].row_strength
+        self.game_state_matrix.change_score_player(side, self.player_strength[side])
 
     def end_game(self):
         """
         Move all cards on the board to their respective graveyard.
         Recalculates board strength after moving all cards to graveyards.
         """
-        for i in range(6):
-            if i < 3:
-                self.graveyards[0].add_row(self.rows[i])
-            else:
-                self.graveyards[1].add_row(self.rows[i])
-            self.rows[i].clear_row()
-            self.rows[i] = Row(i, self.game_state_matrix)
+        for row in self.rows:
+            # Rows 0-2 belong to player 0, rows 3-5 to player 1
+            self.graveyards[row.id // 3].add_row(row)
+            row.reset()
 
         self.calculate_strength()
 
 
+# Board methods placing a card with the given ability, abilities not listed are placed by Board.place_default
+PLACEMENT_BY_ABILITY = {
+    Ability.WEATHER: Board.place_weather,
+    Ability.SPY: Board.place_spy,
+    Ability.SCORCH: Board.place_scorch,
+    Ability.MUSTER: Board.place_muster,
+    Ability.MEDIC: Board.place_medic,
+    Ability.DECOY: Board.place_decoy,
+}
+
+
 class Card:
     """
     A class representing a card in a game.
 
     Attributes:
     -----------
-        ability : str
+        ability : Ability
             The ability of the card.
         id : int
             The ID of the card.
         strength : int
             The strength of the card.
-        type : str
+        type : CardType
             The type of the card.
         placement : int
             The placement of the card.
@@ -806,18 +892,45 @@ class Card:
             The current strength of card with all modifiers and weather applied
         special_argument: int
             Attribute used for medics and decoys to determined who to resurrect.
+        place : function
+            The Board method that places this card, chosen by its ability.
     """
 
+    __slots__ = ('name', 'ability', 'id', 'strength', 'type', 'placement', 'strength_modifier', 'special_argument',
+                 'current_strength', 'place')
+
     def __init__(self, ability, _id, strength, _type, placement, strength_modifier=1, name=None):
         self.name = name
-        self.ability = ability
+        self.ability = ABILITY_BY_NAME[ability] if isinstance(ability, str) else Ability(ability)
         self.id = _id
         self.strength = strength
-        self.type = _type
+        self.type = TYPE_BY_NAME[_type] if isinstance(_type, str) else CardType(_type)
         self.placement = placement
         self.strength_modifier = strength_modifier
         self.special_argument = -1
         self.current_strength = strength
+        self.place = PLACEMENT_BY_ABILITY.get(self.ability, Board.place_default)
+
+    def copy(self):
+        """
+        Creates a new card with the same attributes, without going through the name lookups of the constructor.
+
+        Returns:
+            Card:
+                The copy of the card.
+        """
+        card = Card.__new__(Card)
+        card.name = self.name
+        card.ability = self.ability
+        card.id = self.id
+        card.strength = self.strength
+        card.type = self.type
+        card.placement = self.placement
+        card.strength_modifier = self.strength_modifier
+        card.special_argument = self.special_argument
+        card.current_strength = self.current_strength
+        card.place = self.place
+        return card
 
 
 class Deck:
@@ -826,10 +939,15 @@ class Deck:
 
     Attributes:
     -----------
-        cards (list):
-            A list of cards in the deck.
+        card_ids (ndarray):
+            An int16 ndarray holding the IDs of the cards in the deck, only the first `size` entries are valid.
+        size (int):
+            The number of cards in the deck.
+        card_prototypes (dict):
+            A dictionary mapping card IDs to the Card object that drawn cards are copied from.
         cards_count (ndarray):
-            An ndarray of length 120 containing counts of each card in deck.
+            An ndarray of length 120 containing counts of each card in deck. It is a view of the deck row of
+            the owner's state matrix, so updating it updates the game state.
     """
 
     def __init__(self, _id, game_state_matrix):
@@ -838,26 +956,30 @@ class Deck:
         """
         self.game_state_matrix = game_state_matrix
         self.id = _id
-        self.cards = []
-        self.cards_count = np.zeros(120)
+        self.card_ids = np.empty(40, dtype=np.int16)
+        self.size = 0
+        self.card_prototypes = {}
+        self.cards_count = self.game_state_matrix.deck_counts[self.id]
         # random.seed(0)
 
     def draw(self):
         """
         Draws a random card from the deck.
+        The drawn card is swapped with the last card in the deck, so removing it does not shift the array.
 
         Returns:
             Card or None:
                 The drawn card if the deck is not empty, None otherwise.
         """
-        if len(self.cards) == 0:
+        if self.size == 0:
             return None
         else:
-            index = random.randrange(len(self.cards))
-            card = self.cards.pop(index)
-            self.cards_count[card.id] -= 1
-            self.game_state_matrix.change_deck_count(self.id, card.id, self.cards_count[card.id])
-            return card
+            index = random.randrange(self.size)
+            card_id = int(self.card_ids[index])
+            self.size -= 1
+            self.card_ids[index] = self.card_ids[self.size]
+            self.cards_count[card_id] -= 1
+            return self.card_prototypes[card_id].copy()
 
     def add(self, card):
         """
@@ -867,9 +989,12 @@ class Deck:
             card (Card):
                 The card to add to the deck.
         """
-        self.cards.append(card)
+        if self.size == len(self.card_ids):
+            self.card_ids = np.resize(self.card_ids, 2 * self.size)
+        self.card_ids[self.size] = card.id
+        self.size += 1
+        self.card_prototypes.setdefault(card.id, card)
         self.cards_count[card.id] += 1
-        self.game_state_matrix.change_deck_count(self.id, card.id, self.cards_count[card.id])
 
     def draw_card_by_id(self, card_id):
         """
@@ -882,10 +1007,13 @@ class Deck:
             List[Card]:
                 A list of cards with the specified ID.
         """
-        drawn_cards = [card for card in self.cards if card.id == card_id]
-        self.cards = [card for card in self.cards if card.id != card_id]
+        card_ids = self.card_ids[:self.size]
+        drawn = card_ids == card_id
+        kept = card_ids[~drawn]
+        self.size = len(kept)
+        self.card_ids[:self.size] = kept
+        drawn_cards = [self.card_prototypes[card_id].copy() for _ in range(np.count_nonzero(drawn))]
         self.cards_count[card_id] = 0
-        self.game_state_matrix.change_deck_count(self.id, card_id, self.cards_count[card_id])
         return drawn_cards
 
     def get_state(self):
@@ -900,182 +1028,110 @@ class Deck:
 
 
 class GameState:
+    __slots__ = ('state_matrices', 'state_matrix_0', 'state_matrix_1', 'matrices', 'version', 'deck_counts',
+                 'row_targets', 'observation')
+
     def __init__(self):
-        self.state_matrix_0 = np.zeros((20, 148))
-        self.state_matrix_1 = np.zeros((20, 148))
-
-    def starting_state(self, all_cards):
-        for group in all_cards.values():
-            for card in group:
-                self.state_matrix_0[16][card['Id']] = card['Strength']
-                self.state_matrix_0[17][card['Id']] = transform(card['Type'])
-                self.state_matrix_0[18][card['Id']] = transform(card['Ability'])
-                self.state_matrix_0[19][card['Id']] = card['Placement']
-                self.state_matrix_1[16][card['Id']] = card['Strength']
-                self.state_matrix_1[17][card['Id']] = transform(card['Type'])
-                self.state_matrix_1[18][card['Id']] = transform(card['Ability'])
-                self.state_matrix_1[19][card['Id']] = card['Placement']
+        # Both players' matrices share one block, so values seen by both players are written at once
+        self.state_matrices = np.zeros((2, 20, 148), dtype=np.int16)
+        self.state_matrix_0 = self.state_matrices[0]
+        self.state_matrix_1 = self.state_matrices[1]
+        self.matrices = (self.state_matrix_0, self.state_matrix_1)
+        # Incremented on every change of hands, rows, graveyards and passes, the parts of the game valid actions
+        # depend on
+        self.version = 0
+        # Decks write their card counts directly into these views
+        self.deck_counts = (self.state_matrix_0[15, :120], self.state_matrix_1[15, :120])
+        # For each board row: matrix of the row's owner, matrix of the opponent and position of the row
+        # (0 melee, 1 ranged, 2 siege), which selects its cells in both matrices
+        self.row_targets = tuple((self.matrices[row // 3], self.matrices[1 - row // 3], row % 3) for row in range(6))
+        self.observation = np.empty_like(self.state_matrices)
+
+    def get_observation(self, id_player):
+        """
+        Returns both matrices with the given player's matrix first. The array is preallocated and overwritten
+        on every call, copy it if it needs to be kept.
+        """
+        self.observation[0] = self.matrices[id_player]
+        self.observation[1] = self.matrices[id_player ^ 1]
+        return self.observation
+
+    def starting_state(self, card_state):
+        self.state_matrices[:, 16:20, :120] = card_state
 
     def change_lives(self, id_player, new_value):
-        if id_player == 0:
-            self.state_matrix_0[:, 123] = new_value
-            self.state_matrix_1[:, 124] = new_value
-        else:
-            self.state_matrix_1[:, 123] = new_value
-            self.state_matrix_0[:, 124] = new_value
+        self.matrices[id_player][:, 123] = new_value
+        self.matrices[id_player ^ 1][:, 124] = new_value
 
     def change_card_count_on_hand(self, id_player, new_value):
-        if id_player == 0:
-            self.state_matrix_0[:, 125] = new_value
-            self.state_matrix_1[:, 126] = new_value
-        else:
-            self.state_matrix_1[:, 125] = new_value
-            self.state_matrix_0[:, 126] = new_value
-
-    def change_deck_count(self, id_player, id_card, new_value):
-        if id_player == 0:
-            self.state_matrix_0[15, id_card] = new_value
-        else:
-            self.state_matrix_1[15, id_card] = new_value
+        self.matrices[id_player][:, 125] = new_value
+        self.matrices[id_player ^ 1][:, 126] = new_value
 
     def change_weather(self, id_row, weather_value):
-        if id_row in [0, 3]:
-            self.state_matrix_0[:, 120] = int(weather_value)
-            self.state_matrix_1[:, 120] = int(weather_value)
-        elif id_row in [1, 4]:
-            self.state_matrix_0[:, 121] = int(weather_value)
-            self.state_matrix_1[:, 121] = int(weather_value)
-        else:
-            self.state_matrix_0[:, 122] = int(weather_value)
-            self.state_matrix_1[:, 122] = int(weather_value)
+        self.state_matrices[:, :, 120 + id_row % 3] = weather_value
 
     def change_row_card_count(self, id_row, id_card, new_count_value):
-        if id_row == 0:
-            self.state_matrix_0[1, id_card] = new_count_value
-            self.state_matrix_1[7, id_card] = new_count_value
-        elif id_row == 1:
-            self.state_matrix_0[3, id_card] = new_count_value
-            self.state_matrix_1[9, id_card] = new_count_value
-        elif id_row == 2:
-            self.state_matrix_0[5, id_card] = new_count_value
-            self.state_matrix_1[11, id_card] = new_count_value
-        elif id_row == 3:
-            self.state_matrix_1[1, id_card] = new_count_value
-            self.state_matrix_0[7, id_card] = new_count_value
-        elif id_row == 4:
-            self.state_matrix_1[3, id_card] = new_count_value
-            self.state_matrix_0[9, id_card] = new_count_value
-        elif id_row == 5:
-            self.state_matrix_1[5, id_card] = new_count_value
-            self.state_matrix_0[11, id_card] = new_count_value
+        self.version += 1
+        own, opponent, position = self.row_targets[id_row]
+        own[1 + 2 * position, id_card] = new_count_value
+        opponent[7 + 2 * position, id_card] = new_count_value
 
     def change_row_card_strength(self, id_row, id_card, new_strength_value):
-        if id_row == 0:
-            self.state_matrix_0[2, id_card] = new_strength_value
-            self.state_matrix_1[8, id_card] = new_strength_value
-        elif id_row == 1:
-            self.state_matrix_0[4, id_card] = new_strength_value
-            self.state_matrix_1[10, id_card] = new_strength_value
-        elif id_row == 2:
-            self.state_matrix_0[6, id_card] = new_strength_value
-            self.state_matrix_1[12, id_card] = new_strength_value
-        elif id_row == 3:
-            self.state_matrix_1[2, id_card] = new_strength_value
-            self.state_matrix_0[8, id_card] = new_strength_value
-        elif id_row == 4:
-            self.state_matrix_1[4, id_card] = new_strength_value
-            self.state_matrix_0[10, id_card] = new_strength_value
-        elif id_row == 5:
-            self.state_matrix_1[6, id_card] = new_strength_value
-            self.state_matrix_0[12, id_card] = new_strength_value
+        own, opponent, position = self.row_targets[id_row]
+        own[2 + 2 * position, id_card] = new_strength_value
+        opponent[8 + 2 * position, id_card] = new_strength_value
+
+    def change_row_card(self, id_row, id_card, new_count_value, new_strength_value):
+        self.version += 1
+        own, opponent, position = self.row_targets[id_row]
+        own[1 + 2 * position, id_card] = new_count_value
+        own[2 + 2 * position, id_card] = new_strength_value
+        opponent[7 + 2 * position, id_card] = new_count_value
+        opponent[8 + 2 * position, id_card] = new_strength_value
 
     def change_hand_card_count(self, id_player, id_card, new_count_value):
-        if id_player == 0:
-            self.state_matrix_0[0, id_card] = new_count_value
-        else:
-            self.state_matrix_1[0, id_card] = new_count_value
+        self.version += 1
+        self.matrices[id_player][0, id_card] = new_count_value
+
+    def change_hand(self, id_player, new_card_count_on_hand, id_card, new_count_value):
+        self.version += 1
+        own = self.matrices[id_player]
+        own[:, 125] = new_card_count_on_hand
+        own[0, id_card] = new_count_value
+        self.matrices[id_player ^ 1][:, 126] = new_card_count_on_hand
 
     def change_graveyard_card_count(self, id_player, id_card, new_count_value):
-        if id_player == 0:
-            self.state_matrix_0[13, id_card] = new_count_value
-            self.state_matrix_1[14, id_card] = new_count_value
-        else:
-            self.state_matrix_1[13, id_card] = new_count_value
-            self.state_matrix_0[14, id_card] = new_count_value
+        self.version += 1
+        self.matrices[id_player][13, id_card] = new_count_value
+        self.matrices[id_player ^ 1][14, id_card] = new_count_value
+
+    def change_graveyard_card_counts(self, id_player, new_count_values):
+        self.version += 1
+        self.matrices[id_player][13, :120] = new_count_values
+        self.matrices[id_player ^ 1][14, :120] = new_count_values
 
     def change_row_additive_modifier(self, id_row, new_value):
-        if id_row == 0:
-            self.state_matrix_0[:, 127] = new_value
-            self.state_matrix_1[:, 130] = new_value
-        elif id_row == 1:
-            self.state_matrix_0[:, 128] = new_value
-            self.state_matrix_1[:, 131] = new_value
-        elif id_row == 2:
-            self.state_matrix_0[:, 129] = new_value
-            self.state_matrix_1[:, 132] = new_value
-        elif id_row == 3:
-            self.state_matrix_1[:, 127] = new_value
-            self.state_matrix_0[:, 130] = new_value
-        elif id_row == 4:
-            self.state_matrix_1[:, 128] = new_value
-            self.state_matrix_0[:, 131] = new_value
-        elif id_row == 5:
-            self.state_matrix_1[:, 129] = new_value
-            self.state_matrix_0[:, 132] = new_value
+        own, opponent, position = self.row_targets[id_row]
+        own[:, 127 + position] = new_value
+        opponent[:, 130 + position] = new_value
 
     def change_row_multiplicative_modifier(self, id_row, new_value):
-        if id_row == 0:
-            self.state_matrix_0[:, 133] = new_value
-            self.state_matrix_1[:, 136] = new_value
-        elif id_row == 1:
-            self.state_matrix_0[:, 134] = new_value
-            self.state_matrix_1[:, 137] = new_value
-        elif id_row == 2:
-            self.state_matrix_0[:, 135] = new_value
-            self.state_matrix_1[:, 138] = new_value
-        elif id_row == 3:
-            self.state_matrix_1[:, 133] = new_value
-            self.state_matrix_0[:, 136] = new_value
-        elif id_row == 4:
-            self.state_matrix_1[:, 134] = new_value
-            self.state_matrix_0[:, 137] = new_value
-        elif id_row == 5:
-            self.state_matrix_1[:, 135] = new_value
-            self.state_matrix_0[:, 138] = new_value
+        own, opponent, position = self.row_targets[id_row]
+        own[:, 133 + position] = new_value
+        opponent[:, 136 + position] = new_value
 
     def change_row_score(self, id_row, new_value):
-        if id_row == 0:
-            self.state_matrix_0[:, 139] = new_value
-            self.state_matrix_1[:, 142] = new_value
-        elif id_row == 1:
-            self.state_matrix_0[:, 140] = new_value
-            self.state_matrix_1[:, 143] = new_value
-        elif id_row == 2:
-            self.state_matrix_0[:, 141] = new_value
-            self.state_matrix_1[:, 144] = new_value
-        elif id_row == 3:
-            self.state_matrix_1[:, 139] = new_value
-            self.state_matrix_0[:, 142] = new_value
-        elif id_row == 4:
-            self.state_matrix_1[:, 140] = new_value
-            self.state_matrix_0[:, 143] = new_value
-        elif id_row == 5:
-            self.state_matrix_1[:, 141] = new_value
-            self.state_matrix_0[:, 144] = new_value
+        own, opponent, position = self.row_targets[id_row]
+        own[:, 139 + position] = new_value
+        opponent[:, 142 + position] = new_value
 
     def change_score_player(self, id_player, new_value):
-        if id_player == 0:
-            self.state_matrix_0[:, 145] = new_value
-            self.state_matrix_1[:, 146] = new_value
-        else:
-            self.state_matrix_1[:, 145] = new_value
-            self.state_matrix_0[:, 146] = new_value
+        self.matrices[id_player][:, 145] = new_value
+        self.matrices[id_player ^ 1][:, 146] = new_value
 
     def change_passed(self, id_player, new_value):
-        if id_player == 0:
-            self.state_matrix_1[:, 147] = int(new_value)
-        else:
-            self.state_matrix_0[:, 147] = int(new_value)
+        self.version += 1
+        self.matrices[id_player ^ 1][:, 147] = new_value
 
 
 class Row:
@@ -1092,8 +1148,11 @@ class Row:
         An array of shape (120,) that stores the current strength of each card in the row.
     multiplier_additive : int
         An integer representing the additive modifier that affects the strength of cards in the row.
-    multiplier_multiplicative : float
-        A float representing the multiplicative modifier that affects the strength of cards in the row.
+    multiplier_multiplicative : int
+        An integer representing the multiplicative modifier that affects the strength of cards in the row.
+    multiplier_card_ids : set
+        IDs of the cards in the row that double its multiplicative modifier, each doubles it once however many
+        copies of it are in the row.
     weather : bool
         A boolean indicating whether weather effect is applied to the row.
     row_strength : int
@@ -1102,6 +1161,12 @@ class Row:
         An integer representing the current highest strength of non-hero cards in the row.
     highest_value_non_hero_list : list
         A list of cards that have the highest strength of non-hero cards in the row.
+    unit_cards : list
+        A flat list of the unit cards in the row, the only cards whose strength changes.
+    non_unit_strength : int
+        The combined strength of the hero and special cards in the row.
+    state : numpy.ndarray
+        An array of shape (2, 120) holding `cards_list_count` and `cards_list_current_strength` as its rows.
 
     """
 
@@ -1112,8 +1177,25 @@ class Row:
         self.game_state_matrix = game_state_matrix
         self.id = _id
         self.cards = {}
-        self.cards_list_count = np.zeros(120)
-        self.cards_list_current_strength = np.zeros(120)
+        self.multiplier_card_ids = set()
+        self.state = np.zeros((2, 120), dtype=np.int16)
+        # Counts and strengths are the two rows of the state, so get_state does not copy them
+        self.cards_list_count = self.state[0]
+        self.cards_list_current_strength = self.state[1]
+        self.reset()
+
+    def reset(self):
+        """
+        Removes all cards, modifiers and weather from the row, reusing its arrays.
+        """
+        for card_id in self.cards:
+            self.game_state_matrix.change_row_card(self.id, card_id, 0, 0)
+        self.cards.clear()
+        self.multiplier_card_ids.clear()
+        self.unit_cards = []
+        self.non_unit_strength = 0
+        self.cards_list_count.fill(0)
+        self.cards_list_current_strength.fill(0)
         self.multiplier_additive = 0
         self.multiplier_multiplicative = 1
         self.weather = False
@@ -1128,39 +1210,42 @@ class Row:
         """
         Activates the weather effect on the row.
         """
-        self.weather = True
-        self.game_state_matrix.change_weather(self.id, self.weather)
-        self.row_strength = 0
-        for card_lists in self.cards.values():
-            for card in card_lists:
-                if card.type == 'Unit':
-                    card.current_strength = self.calculate_card_strength(card)
-                    self.row_strength += card.current_strength
-                else:
-                    self.row_strength += card.current_strength
-            self.cards_list_current_strength[card_lists[0].id] = len(card_lists) * card_lists[0].current_strength
-            self.game_state_matrix.change_row_card_strength(self.id, card_lists[0].id,
-                                                            self.cards_list_current_strength[card_lists[0].id])
-            self.game_state_matrix.change_row_score(self.id, self.row_strength)
+        self.set_weather(True)
 
     def clear_weather(self):
         """
         Clears the weather effect on the row.
         """
-        self.weather = False
+        self.set_weather(False)
+
+    def set_weather(self, weather):
+        """
+        Sets the weather effect of the row and recalculates the strength of its unit cards.
+
+        Args:
+            weather : bool
+                True if the weather effect is applied to the row.
+        """
+        self.weather = weather
         self.game_state_matrix.change_weather(self.id, self.weather)
-        self.row_strength = 0
+        # Weather only changes the strength of unit cards
+        for card in self.unit_cards:
+            card.current_strength = self.calculate_card_strength(card)
+        # Every list is written, this also fills in cards whose strength was never written, such as heroes with Morale
         for card_lists in self.cards.values():
-            for card in card_lists:
-                if card.type == 'Unit':
-                    card.current_strength = self.calculate_card_strength(card)
-                    self.row_strength += card.current_strength
-                else:
-                    self.row_strength += card.current_strength
             self.cards_list_current_strength[card_lists[0].id] = len(card_lists) * card_lists[0].current_strength
             self.game_state_matrix.change_row_card_strength(self.id, card_lists[0].id,
                                                             self.cards_list_current_strength[card_lists[0].id])
-            self.game_state_matrix.change_row_score(self.id, self.row_strength)
+        self.update_row_strength()
+
+    def update_row_strength(self):
+        """
+        Sums the current strength of all cards in the row and writes it to the state matrix.
+        """
+        self.row_strength = self.non_unit_strength
+        for card in self.unit_cards:
+            self.row_strength += card.current_strength
+        self.game_state_matrix.change_row_score(self.id, self.row_strength)
 
     def add_card(self, card):
         """
@@ -1170,10 +1255,8 @@ class Row:
             card : Card
                 A Card object representing the card to be added to the row.
         """
-        if card.id in self.cards:
-            self.cards[card.id].append(card)
-        else:
-            self.cards[card.id] = [card]
+        self.cards.setdefault(card.id, []).append(card)
+        self.track_card(card)
         self.cards_list_count[card.id] += 1
         self.game_state_matrix.change_row_card_count(self.id, card.id, self.cards_list_count[card.id])
         self.activate_cards_modifier(card)
@@ -1189,10 +1272,9 @@ class Row:
             card_list : list of Card objects
                 A list of Card objects to be added to the row.
         """
-        if card_id in self.cards:
-            self.cards[card_id].extend(card_list)
-        else:
-            self.cards[card_id] = card_list
+        self.cards.setdefault(card_id, []).extend(card_list)
+        for card in card_list:
+            self.track_card(card)
         self.cards_list_count[card_id] += len(card_list)
         self.game_state_matrix.change_row_card_count(self.id, card_id, self.cards_list_count[card_id])
         for card in card_list:
@@ -1213,6 +1295,7 @@ class Row:
             card = self.cards[card_id].pop()
             if len(self.cards[card_id]) == 0:
                 del self.cards[card_id]
+            self.untrack_card(card)
             self.remove_cards_modifiers(card)
             self.recalculate_current_strength(card, False)
             if card in self.highest_value_non_hero_list:
@@ -1230,6 +1313,7 @@ class Row:
             self.cards[card.id].remove(card)
             if len(self.cards[card.id]) == 0:
                 del self.cards[card.id]
+            self.untrack_card(card)
             self.recalculate_current_strength(card, False)
             if card.id in self.cards:
                 self.cards_list_count[card.id] = len(self.cards[card.id])
@@ -1244,6 +1328,24 @@ class Row:
         self.find_new_highest()
         return copy
 
+    def track_card(self, card):
+        """
+        Adds a card entering the row to the unit card list or to the strength of non-unit cards.
+        """
+        if card.type == CardType.UNIT:
+            self.unit_cards.append(card)
+        else:
+            self.non_unit_strength += card.current_strength
+
+    def untrack_card(self, card):
+        """
+        Removes a card leaving the row from the unit card list or from the strength of non-unit cards.
+        """
+        if card.type == CardType.UNIT:
+            self.unit_cards.remove(card)
+        else:
+            self.non_unit_strength -= card.current_strength
+
     def recalculate_current_strength(self, card, insert):
         """
         Recalculates the current strength of a card and updates the
@@ -1262,28 +1364,49 @@ class Row:
         Returns:
             None
         """
-        if card.type == 'Weather' or card.ability == 'Morale':
+        if card.type == CardType.WEATHER or card.ability == Ability.MORALE:
+            # Every unit card is recalculated, so the highest of them and the row strength are found in the same pass
+            highest_value = -1
+            highest_list = []
+            units_strength = 0
             for card_lists in self.cards.values():
+                count = len(card_lists)
                 for c in card_lists:
-                    if c.type == 'Unit':
+                    if c.type == CardType.UNIT:
                         current_strength = self.calculate_card_strength(c)
                         c.current_strength = current_strength
-                        self.cards_list_current_strength[c.id] = len(card_lists) * current_strength
+                        units_strength += current_strength
+                        self.cards_list_current_strength[c.id] = count * current_strength
                         self.game_state_matrix.change_row_card_strength(self.id, c.id,
                                                                         self.cards_list_current_strength[c.id])
-                        if insert:
-                            self.check_max(c)
-        elif card.ability == 'Bond' and card.id in self.cards:
-            for c in self.cards[card.id]:
-                c.strength_modifier = len(self.cards[card.id])
+                        if current_strength > highest_value:
+                            highest_value = current_strength
+                            highest_list = [c]
+                        elif current_strength == highest_value:
+                            highest_list.append(c)
+            if insert:
+                # Same result as calling check_max on every unit card in order
+                if highest_value > self.highest_value_non_hero:
+                    self.highest_value_non_hero = highest_value
+                    self.highest_value_non_hero_list = highest_list
+                elif highest_value == self.highest_value_non_hero:
+                    self.highest_value_non_hero_list.extend(highest_list)
+            self.row_strength = self.non_unit_strength + units_strength
+            self.game_state_matrix.change_row_score(self.id, self.row_strength)
+            return
+        elif card.ability == Ability.BOND and card.id in self.cards:
+            bonded_cards = self.cards[card.id]
+            count = len(bonded_cards)
+            for c in bonded_cards:
+                c.strength_modifier = count
                 current_strength = self.calculate_card_strength(c)
                 c.current_strength = current_strength
-                self.cards_list_current_strength[c.id] = len(self.cards[card.id]) * current_strength
+                self.cards_list_current_strength[c.id] = count * current_strength
                 self.game_state_matrix.change_row_card_strength(self.id, c.id,
                                                                 self.cards_list_current_strength[c.id])
                 if insert:
                     self.check_max(c)
-        elif card.type == 'Unit' and not card.ability == 'Bond' and not card.ability == 'Morale':
+        elif card.type == CardType.UNIT and not card.ability == Ability.BOND and not card.ability == Ability.MORALE:
             current_strength = self.calculate_card_strength(card)
             card.current_strength = current_strength
             self.cards_list_current_strength[card.id] = current_strength * len(self.cards[card.id])
@@ -1296,11 +1419,7 @@ class Row:
             self.game_state_matrix.change_row_card_strength(self.id, card.id,
                                                             self.cards_list_current_strength[card.id])
 
-        self.row_strength = 0
-        for card_list in self.cards.values():
-            for card_c in card_list:
-                self.row_strength += card_c.current_strength
-        self.game_state_matrix.change_row_score(self.id, self.row_strength)
+        self.update_row_strength()
 
     def calculate_card_strength(self, card):
         """
@@ -1329,21 +1448,26 @@ class Row:
             card (Card):
                 The card object to remove the modifiers from.
         """
-        if card.ability == 'Morale':
-            if card.name == 'Dandelion' or card.type == 'Morale':
-                # If the card is either Dandelion or has the Morale type, divide the player's multiplier by 2
-                self.multiplier_multiplicative /= 2
-                self.game_state_matrix.change_row_multiplicative_modifier(self.id, self.multiplier_multiplicative)
-            elif card.ability == 'Morale' and not card.name == 'Dandelion' and not card.type == 'Morale':
+        if card.ability == Ability.MORALE:
+            if card.id == DANDELION_ID or card.type == CardType.MORALE:
+                # If the card is either Dandelion or has the Morale type and its last copy left the row, halve the
+                # multiplier it doubled
+                if card.id in self.multiplier_card_ids and card.id not in self.cards:
+                    self.multiplier_card_ids.discard(card.id)
+                    self.multiplier_multiplicative //= 2
+                    self.game_state_matrix.change_row_multiplicative_modifier(self.id, self.multiplier_multiplicative)
+            else:
                 # If the card is of Morale type but not Dandelion, subtract 1 from the player's additive multiplier
                 self.multiplier_additive -= 1
                 self.game_state_matrix.change_row_additive_modifier(self.id, self.multiplier_additive)
-        elif card.ability == 'Bond':
+        elif card.ability == Ability.BOND:
             # For each card in the player's deck with the same ID as the given card, set its strength modifier to the
             # length of the deck
             if card.id in self.cards:
-                for c in self.cards[card.id]:
-                    c.strength_modifier = len(self.cards[card.id])
+                bonded_cards = self.cards[card.id]
+                count = len(bonded_cards)
+                for c in bonded_cards:
+                    c.strength_modifier = count
 
     def activate_cards_modifier(self, card):
         """
@@ -1353,21 +1477,25 @@ class Row:
             card (Card):
                 The card object to activate the modifiers for.
         """
-        if card.ability == 'Morale':
-            if (card.name == 'Dandelion' or card.type == 'Morale') and len(self.cards[card.id]) == 1:
-                # If the card is either Dandelion or has the Morale type and only one of it is in the row,
-                # multiply the multiplier by 2
-                self.multiplier_multiplicative *= 2
-                self.game_state_matrix.change_row_multiplicative_modifier(self.id, self.multiplier_multiplicative)
-            elif card.ability == 'Morale' and not card.name == 'Dandelion' and not card.type == 'Morale':
+        if card.ability == Ability.MORALE:
+            if card.id == DANDELION_ID or card.type == CardType.MORALE:
+                # If the card is either Dandelion or has the Morale type and no copy of it doubled the multiplier
+                # yet, multiply the multiplier by 2
+                if card.id not in self.multiplier_card_ids:
+                    self.multiplier_card_ids.add(card.id)
+                    self.multiplier_multiplicative *= 2
+                    self.game_state_matrix.change_row_multiplicative_modifier(self.id, self.multiplier_multiplicative)
+            elif not card.id == DANDELION_ID and not card.type == CardType.MORALE:
                 # If the card is of Morale type but not Dandelion, add 1 to the row's additive multiplier
                 self.multiplier_additive += 1
                 self.game_state_matrix.change_row_additive_modifier(self.id, self.multiplier_additive)
-        elif card.ability == 'Bond':
+        elif card.ability == Ability.BOND:
             # For each card in the player's deck with the same ID as the given card, set its strength modifier to the
             # length of the row
-            for c in self.cards[card.id]:
-                c.strength_modifier = len(self.cards[card.id])
+            bonded_cards = self.cards[card.id]
+            count = len(bonded_cards)
+            for c in bonded_cards:
+                c.strength_modifier = count
 
     def check_max(self, card):
         """
@@ -1397,30 +1525,24 @@ class Row:
         self.highest_value_non_hero_list = []
         for card_list in self.cards.values():
             for card in card_list:
-                if card.type == 'Unit' and card.current_strength > self.highest_value_non_hero:
+                if card.type == CardType.UNIT and card.current_strength > self.highest_value_non_hero:
                     self.highest_value_non_hero_list = [card]
                     self.highest_value_non_hero = card.current_strength
-                elif card.type == 'Unit' and card.current_strength == self.highest_value_non_hero:
+                elif card.type == CardType.UNIT and card.current_strength == self.highest_value_non_hero:
                     self.highest_value_non_hero_list.append(card)
 
     def get_state(self):
         """
         Creates 120x2 matrix indicating state of row,
         first row number of each card in row,
-        second row combined current strength of cards with same id
+        second row combined current strength of cards with same id.
+        The matrix is updated in place as the row changes, copy it if it needs to be kept.
 
         Returns :
             ndarray[int] 120x2:
                 number of cards and combined strength of each card
         """
-        state = np.vstack((self.cards_list_count, self.cards_list_current_strength))
-        return state
-
-    def clear_row(self):
-        for card_list in self.cards.values():
-            for card in card_list:
-                self.game_state_matrix.change_row_card_count(self.id, card.id, 0)
-                self.game_state_matrix.change_row_card_strength(self.id, card.id, 0)
+        return self.state
 
 
 class Graveyard:
@@ -1432,8 +1554,12 @@ class Graveyard:
     -----------
         cards: dict
             A dictionary containing lists of cards, where the keys are card IDs.
+        medic_ids: list
+            IDs of the medic units in `cards`, in the order their lists were created.
     """
 
+    __slots__ = ('game_state_matrix', 'id', 'cards', 'medic_ids', 'cards_count')
+
     def __init__(self, _id, game_state_matrix):
         """
         Constructor for Graveyard class. Initializes an empty dictionary to store the cards.
@@ -1441,7 +1567,22 @@ class Graveyard:
         self.game_state_matrix = game_state_matrix
         self.id = _id
         self.cards = {}
-        self.cards_count = np.zeros(120)
+        self.medic_ids = []
+        self.cards_count = np.zeros(120, dtype=np.int16)
+
+    def get_card_list(self, card):
+        """
+        Returns the list of cards with the same ID as the given card, creating it if needed.
+
+        Args:
+            card: Card
+                A card of the ID whose list is returned.
+        """
+        if card.id not in self.cards:
+            self.cards[card.id] = []
+            if card.ability == Ability.MEDIC and card.type == CardType.UNIT:
+                self.medic_ids.append(card.id)
+        return self.cards[card.id]
 
     def add_row(self, row: Row):
         """
@@ -1454,8 +1595,11 @@ class Graveyard:
         Returns:
         None
         """
-        for card_id, card_list in row.cards.items():
-            self.insert_list(card_id, card_list)
+        for card_list in row.cards.values():
+            self.get_card_list(card_list[0]).extend(card_list)
+        # The row already counts its cards per id, so all counts are added at once
+        self.cards_count += row.cards_list_count
+        self.game_state_matrix.change_graveyard_card_counts(self.id, self.cards_count)
 
     def insert_list(self, card_id, card_list):
         """
@@ -1470,10 +1614,9 @@ class Graveyard:
         Returns:
         None
         """
-        if card_id in self.cards:
-            self.cards[card_id].extend(card_list)
-        else:
-            self.cards[card_id] = card_list
+        if not card_list:
+            return
+        self.get_card_list(card_list[0]).extend(card_list)
         self.cards_count[card_id] += len(card_list)
         self.game_state_matrix.change_graveyard_card_count(self.id, card_id, self.cards_count[card_id])
 
@@ -1492,16 +1635,20 @@ class Graveyard:
         """
         if card_id in self.cards:
             cards_to_revive = []
-            for card_list in self.cards.values():
-                if len(card_list) > 0 and card_list[0].ability == 'Medic' and card_list[0].type == 'Unit':
+            revived_medic_ids = []
+            # Only the medic lists are visited, in the same order as in the dictionary
+            for medic_id in self.medic_ids:
+                card_list = self.cards[medic_id]
+                if len(card_list) > 0:
                     cards_to_revive.extend(card_list)
-                    self.cards_count[card_list[0].id] = 0
-                    self.game_state_matrix.change_graveyard_card_count(self.id, card_list[0].id,
-                                                                       self.cards_count[card_list[0].id])
-            cards_to_revive.extend([self.cards[card_id].pop()])
-            self.cards_count[card_id] -= 1
-            self.game_state_matrix.change_graveyard_card_count(self.id, card_id,
-                                                               self.cards_count[card_id])
+                    card_list.clear()
+                    revived_medic_ids.append(medic_id)
+            self.cards_count[revived_medic_ids] = 0
+            # A medic chosen as the target has already been revived with the other medics
+            if self.cards[card_id]:
+                cards_to_revive.append(self.cards[card_id].pop())
+                self.cards_count[card_id] -= 1
+            self.game_state_matrix.change_graveyard_card_counts(self.id, self.cards_count)
 
             return cards_to_revive
 
@@ -1525,10 +1672,7 @@ class Graveyard:
             card:
                 A Card object to be inserted into the graveyard.
         """
-        if card.id in self.cards:
-            self.cards[card.id].append(card)
-        else:
-            self.cards[card.id] = [card]
+        self.get_card_list(card).append(card)
         self.cards_count[card.id] += 1
         self.game_state_matrix.change_graveyard_card_count(self.id, card.id,
                                                            self.cards_count[card.id])
@@ -1560,8 +1704,18 @@ class Player:
             A flag indicating whether the player has passed their turn.
         cards_count(ndarray):
             Array representing counts of each card in player's hand.
+        hand_ids (ndarray):
+            IDs of the cards in the player's hand, in the order of `hand`. Only the first len(hand)
+            elements are valid.
+        hand_placements (ndarray):
+            Placements of the cards in the player's hand, in the order of `hand`.
+        hand_special_arguments (ndarray):
+            Special arguments of the cards in the player's hand, in the order of `hand`.
     """
 
+    __slots__ = ('game_state_matrix', 'id', 'hand', 'hand_ids', 'hand_placements', 'hand_special_arguments',
+                 'cards_count', 'lives', 'deck', 'passed')
+
     def __init__(self, _id, deck, game_state_matrix):
         """
         Initializes a player object with a deck of cards.
@@ -1573,7 +1727,10 @@ class Player:
         self.game_state_matrix = game_state_matrix
         self.id = _id
         self.hand = []
-        self.cards_count = np.zeros(120)
+        self.hand_ids = np.zeros(16, dtype=np.int16)
+        self.hand_placements = np.zeros(16, dtype=np.int16)
+        self.hand_special_arguments = np.zeros(16, dtype=np.int16)
+        self.cards_count = np.zeros(120, dtype=np.int16)
         self.lives = 2
         self.deck = deck
         self.passed = False
@@ -1586,11 +1743,7 @@ class Player:
         """
         Draws a card from the deck and adds it to the player's hand.
         """
-        card = self.deck.draw()
-        self.hand.append(card)
-        self.cards_count[card.id] += 1
-        self.game_state_matrix.change_card_count_on_hand(self.id, len(self.hand))
-        self.game_state_matrix.change_hand_card_count(self.id, card.id, self.cards_count[card.id])
+        self.add_card(self.deck.draw())
 
     def play(self, card):
         """
@@ -1600,10 +1753,7 @@ class Player:
             card (Card):
                 The card to remove from the player's hand.
         """
-        self.hand.remove(card)
-        self.cards_count[card.id] -= 1
-        self.game_state_matrix.change_card_count_on_hand(self.id, len(self.hand))
-        self.game_state_matrix.change_hand_card_count(self.id, card.id, self.cards_count[card.id])
+        self.remove_card(self.hand.index(card))
 
     def take_damage(self):
         """
@@ -1626,11 +1776,7 @@ class Player:
         if self.lives > 0:
             self.passed = False
             self.game_state_matrix.change_passed(self.id, self.passed)
-            card = self.deck.draw()
-            self.hand.append(card)
-            self.cards_count[card.id] += 1
-            self.game_state_matrix.change_card_count_on_hand(self.id, len(self.hand))
-            self.game_state_matrix.change_hand_card_count(self.id, card.id, self.cards_count[card.id])
+            self.add_card(self.deck.draw())
 
     def get_card_by_id(self, card_id):
         """
@@ -1644,12 +1790,9 @@ class Player:
             Card:
                 The card with the specified ID, or None if the card is not found in the player's hand.
         """
-        for card in self.hand:
+        for index, card in enumerate(self.hand):
             if card.id == card_id:
-                self.hand.remove(card)
-                self.cards_count[card.id] -= 1
-                self.game_state_matrix.change_card_count_on_hand(self.id, len(self.hand))
-                self.game_state_matrix.change_hand_card_count(self.id, card.id, self.cards_count[card.id])
+                self.remove_card(index)
                 return card
         return None
 
@@ -1661,10 +1804,33 @@ class Player:
             card (Card):
                 The card object to add to player's hand.
         """
+        size = len(self.hand)
+        if size == self.hand_ids.shape[0]:
+            self.hand_ids = np.resize(self.hand_ids, 2 * size)
+            self.hand_placements = np.resize(self.hand_placements, 2 * size)
+            self.hand_special_arguments = np.resize(self.hand_special_arguments, 2 * size)
+        self.hand_ids[size] = card.id
+        self.hand_placements[size] = card.placement
+        self.hand_special_arguments[size] = card.special_argument
         self.hand.append(card)
         self.cards_count[card.id] += 1
-        self.game_state_matrix.change_card_count_on_hand(self.id, len(self.hand))
-        self.game_state_matrix.change_hand_card_count(self.id, card.id, self.cards_count[card.id])
+        self.game_state_matrix.change_hand(self.id, len(self.hand), card.id, self.cards_count[card.id])
+
+    def remove_card(self, index):
+        """
+        Removes card at the given position from player's hand.
+
+        Args:
+            index (int):
+                The position of the card in player's hand.
+        """
+        card = self.hand.pop(index)
+        size = len(self.hand)
+        self.hand_ids[index:size] = self.hand_ids[index + 1:size + 1]
+        self.hand_placements[index:size] = self.hand_placements[index + 1:size + 1]
+        self.hand_special_arguments[index:size] = self.hand_special_arguments[index + 1:size + 1]
+        self.cards_count[card.id] -= 1
+        self.game_state_matrix.change_hand(self.id, len(self.hand), card.id, self.cards_count[card.id])
 
     def get_number_of_cards(self):
         """
@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+FACTIONS = ('Northern Realms', 'Scoiatael', 'Neutral', 'Nilfgaard', 'Monsters')
+
+
+@pytest.fixture(scope='session')
+def all_cards():
+    """
+    Cards from Gwent.csv grouped by faction, in the format used by Game.
+    """
+    result = {}
+    faction = None
+    with open(os.path.join(ROOT, 'Gwent.csv'), 'r') as f:
+        for line in f.read().splitlines():
+            if line == '':
+                continue
+            if line.strip(',') in FACTIONS:
+                faction = line.strip(',')
+                result[faction] = []
+                continue
+            name, _id, strength, ability, card_type, placement, count = line.split(',')[:7]
+            if name == 'Name':
+                continue
+            result[faction].append({'Name': name, 'Id': int(_id), 'Strength': int(strength), 'Ability': ability,
+                                    'Type': card_type, 'Placement': int(placement), 'Count': int(count),
+                                    'Faction': faction})
+    return result
@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from Game.Game import Game
+
+VES = 5
+DANDELION = 52
+SCORCH = 59
+BITING_FROST = 60
+MORTEISEN = 72
+ETOLIAN_AUXILIARY_ARCHERS = 84
+KAYRAN = 93
+
+
+@pytest.fixture
+def game(all_cards):
+    random.seed(0)
+    return Game(all_cards)
+
+
+def test_valid_actions_returns_new_objects_on_every_call(game):
+    mask, valid_actions = game.valid_actions()
+    expected_mask, expected_actions = list(mask), list(valid_actions)
+    mask[:] = [False] * len(mask)
+    valid_actions.clear()
+
+    cached_mask, cached_actions = game.valid_actions()
+
+    assert list(cached_mask) == expected_mask
+    assert cached_actions == expected_actions
+
+
+def test_valid_actions_follow_pass_made_outside_step(game):
+    assert '-1' in game.valid_actions()[1]
+
+    game.players[game.turn].pass_game()
+
+    mask, valid_actions = game.valid_actions()
+    assert '-1' not in valid_actions
+    assert not mask[-1]
+
+
+def test_valid_actions_follow_graveyard_changes_made_outside_step(game):
+    game.give_card(game.turn, ETOLIAN_AUXILIARY_ARCHERS)
+    assert '84,1,72' not in game.valid_actions()[1]
+
+    game.board.graveyards[game.turn].insert_card(game.create_card(MORTEISEN))
+
+    assert '84,1,72' in game.valid_actions()[1]
+
+
+def test_medic_ignores_graveyard_units_of_other_factions(game):
+    # Player 0 plays Nilfgaard, Ves is a Northern Realms unit without a revive action for Nilfgaard medics
+    game.board.graveyards[0].insert_card(game.create_card(VES))
+    game.give_card(0, ETOLIAN_AUXILIARY_ARCHERS)
+
+    mask, valid_actions = game.valid_actions()
+
+    assert valid_actions.count('-1') == 1
+    assert valid_actions[-1] == '-1'
+    assert mask.sum() == len(set(valid_actions))
+    assert all(mask[game.get_index_of_action(action)] for action in valid_actions)
+
+
+def test_passed_player_has_no_pass_action(game):
+    game.board.graveyards[0].insert_card(game.create_card(VES))
+    game.give_card(0, ETOLIAN_AUXILIARY_ARCHERS)
+    game.players[0].pass_game()
+    game.give_card(0, ETOLIAN_AUXILIARY_ARCHERS)
+
+    mask, valid_actions = game.valid_actions()
+
+    assert '-1' not in valid_actions
+    assert not mask[-1]
+
+
+def test_scorched_dandelions_restore_row_multiplier(game):
+    game.board.place_card(game.create_card(DANDELION), 0)
+    game.board.place_card(game.create_card(DANDELION), 0)
+    game.board.place_card(game.create_card(SCORCH), 0)
+
+    assert game.board.rows[0].multiplier_multiplicative == 1
+    assert (game.game_state_matrix.state_matrix_0[:, 133] == 1).all()
+    assert (game.game_state_matrix.state_matrix_1[:, 136] == 1).all()
+
+
+def test_weather_writes_strength_of_hero_with_morale(game):
+    turn = game.turn
+    game.give_card(turn, KAYRAN)
+    game.step(game.get_index_of_action('93,0,-1'))
+    game.give_card(game.turn, BITING_FROST)
+    game.step(game.get_index_of_action('60,0,-1'))
+
+    # Melee strengths are row 2 of the owner's matrix and row 8 of the opponent's matrix
+    own = game.game_state_matrix.matrices[turn]
+    opponent = game.game_state_matrix.matrices[turn ^ 1]
+    assert own[2, KAYRAN] == 18
+    assert opponent[8, KAYRAN] == 18
+
+
+def test_medic_revives_medic_from_graveyard(game):
+    turn = game.turn
+    graveyard = game.board.graveyards[turn]
+    graveyard.insert_card(game.create_card(ETOLIAN_AUXILIARY_ARCHERS))
+    game.give_card(turn, ETOLIAN_AUXILIARY_ARCHERS)
+    game.step(game.get_index_of_action('84,1,84'))
+
+    for card_id, card_list in graveyard.cards.items():
+        assert graveyard.cards_count[card_id] == len(card_list)
+    assert (graveyard.cards_count >= 0).all()
+    assert (game.game_state_matrix.state_matrices[:, 13:15] >= 0).all()
+    board_cards = {id(card) for row in game.board.rows for card_list in row.cards.values() for card in card_list}
+    graveyard_cards = {id(card) for card_list in graveyard.cards.values() for card in card_list}
+    assert not board_cards & graveyard_cards